@@ -7,17 +7,16 @@ from datetime import timedelta
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryNotReady
 
 from .const import DOMAIN
 from .coordinator import RK6006Coordinator
 
-PLATFORMS: list[Platform] = [
+PLATFORMS: tuple[Platform, ...] = (
     Platform.SENSOR,
     Platform.NUMBER,
     Platform.SWITCH,
     Platform.BINARY_SENSOR,
-]
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,15 +24,16 @@ _LOGGER = logging.getLogger(__name__)
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up RK6006 from a config entry."""
     coordinator = RK6006Coordinator(hass, entry)
-    
-    # Only require first refresh if connection is enabled
-    # If disabled, entities will load but be unavailable until connection is enabled
+
+    # Run the first refresh in the background so a slow BLE connection
+    # doesn't block startup; entities show as unknown until it completes.
+    # If the connection is disabled, entities load but stay unavailable
+    # until the connection is enabled
     if coordinator.connection_enabled:
-        try:
-            await coordinator.async_config_entry_first_refresh()
-        except Exception as err:
-            raise ConfigEntryNotReady(f"Unable to connect to RK6006: {err}") from err
-    
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), "rk6006-first-refresh"
+        )
+
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
     
@@ -4,15 +4,41 @@ from __future__ import annotations
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
+    BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER, MODEL
+from .const import DOMAIN
 from .coordinator import RK6006Coordinator
 
+BINARY_SENSOR_DESCRIPTIONS: tuple[BinarySensorEntityDescription, ...] = (
+    BinarySensorEntityDescription(
+        key="cv_mode",
+        name="RK6006 CV Mode",
+        icon="mdi:current-dc",
+    ),
+    BinarySensorEntityDescription(
+        key="cc_mode",
+        name="RK6006 CC Mode",
+        icon="mdi:current-ac",
+    ),
+    BinarySensorEntityDescription(
+        key="ovp_triggered",
+        name="RK6006 OVP Triggered",
+        icon="mdi:flash-alert",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+    ),
+    BinarySensorEntityDescription(
+        key="ocp_triggered",
+        name="RK6006 OCP Triggered",
+        icon="mdi:flash-alert",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+    ),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -23,106 +49,33 @@ async def async_setup_entry(
     coordinator: RK6006Coordinator = hass.data[DOMAIN][entry.entry_id]
 
     async_add_entities(
-        [
-            RK6006CVModeBinarySensor(coordinator),
-            RK6006CCModeBinarySensor(coordinator),
-            RK6006OVPBinarySensor(coordinator),
-            RK6006OCPBinarySensor(coordinator),
-        ]
+        RK6006BinarySensor(coordinator, description)
+        for description in BINARY_SENSOR_DESCRIPTIONS
     )
 
 
-class RK6006CVModeBinarySensor(CoordinatorEntity, BinarySensorEntity):
-    """Binary sensor for CV (Constant Voltage) mode."""
-
-    _attr_icon = "mdi:current-dc"
-    _attr_device_class = None
-
-    def __init__(self, coordinator: RK6006Coordinator) -> None:
-        """Initialize the binary sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.address}_cv_mode"
-        self._attr_name = "RK6006 CV Mode"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.address)},
-            "name": "RK6006 Power Supply",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-        }
-
-    @property
-    def is_on(self) -> bool:
-        """Return True if in CV (Constant Voltage) mode."""
-        return self.coordinator.data.get("output_mode") == "CV"
-
-
-class RK6006CCModeBinarySensor(CoordinatorEntity, BinarySensorEntity):
-    """Binary sensor for CC (Constant Current) mode."""
-
-    _attr_icon = "mdi:current-ac"
-    _attr_device_class = None
-
-    def __init__(self, coordinator: RK6006Coordinator) -> None:
-        """Initialize the binary sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.address}_cc_mode"
-        self._attr_name = "RK6006 CC Mode"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.address)},
-            "name": "RK6006 Power Supply",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-        }
-
-    @property
-    def is_on(self) -> bool:
-        """Return True if in CC (Constant Current) mode."""
-        return self.coordinator.data.get("output_mode") == "CC"
-
-
-class RK6006OVPBinarySensor(CoordinatorEntity, BinarySensorEntity):
-    """Binary sensor for OVP (Over Voltage Protection) trigger."""
-
-    _attr_icon = "mdi:flash-alert"
-    _attr_device_class = BinarySensorDeviceClass.PROBLEM
-
-    def __init__(self, coordinator: RK6006Coordinator) -> None:
-        """Initialize the binary sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.address}_ovp_triggered"
-        self._attr_name = "RK6006 OVP Triggered"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.address)},
-            "name": "RK6006 Power Supply",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-        }
-
-    @property
-    def is_on(self) -> bool:
-        """Return True if OVP is triggered."""
-        return self.coordinator.data.get("ovp_triggered", False)
-
-
-class RK6006OCPBinarySensor(CoordinatorEntity, BinarySensorEntity):
-    """Binary sensor for OCP (Over Current Protection) trigger."""
-
-    _attr_icon = "mdi:flash-alert"
-    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+class RK6006BinarySensor(CoordinatorEntity, BinarySensorEntity):
+    """Binary sensor driven by an entity description."""
 
-    def __init__(self, coordinator: RK6006Coordinator) -> None:
+    def __init__(
+        self,
+        coordinator: RK6006Coordinator,
+        description: BinarySensorEntityDescription,
+    ) -> None:
         """Initialize the binary sensor."""
         super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.address}_ocp_triggered"
-        self._attr_name = "RK6006 OCP Triggered"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.address)},
-            "name": "RK6006 Power Supply",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-        }
+        self.entity_description = description
+        self._attr_unique_id = f"{coordinator.address}_{description.key}"
+        self._attr_device_info = coordinator.device_info
 
     @property
     def is_on(self) -> bool:
-        """Return True if OCP is triggered."""
-        return self.coordinator.data.get("ocp_triggered", False)
+        """Return True if the sensor condition is met."""
+        if (data := self.coordinator.data) is None:
+            return False
+        key = self.entity_description.key
+        if key == "cv_mode":
+            return data.output_mode == "CV"
+        if key == "cc_mode":
+            return data.output_mode == "CC"
+        return getattr(data, key)
@@ -14,7 +14,7 @@ from homeassistant.components.bluetooth import (
 from homeassistant.const import CONF_ADDRESS
 from homeassistant.data_entry_flow import FlowResult
 
-from .const import DOMAIN
+from .const import DOMAIN, UART_SERVICE_UUID
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -81,7 +81,7 @@ class RK6006ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             if discovery_info.address in current_addresses:
                 continue
             # Match by service UUID since RK6006 doesn't always advertise a name
-            if "0000ffe0-0000-1000-8000-00805f9b34fb" not in discovery_info.service_uuids:
+            if UART_SERVICE_UUID not in discovery_info.service_uuids:
                 continue
             self._discovered_devices[discovery_info.address] = discovery_info
 
@@ -6,9 +6,21 @@ DOMAIN = "rk6006"
 CONF_MAC_ADDRESS = "mac_address"
 CONF_CONNECTION_ENABLED = "connection_enabled"
 
-# Update interval
-UPDATE_INTERVAL = 2  # seconds
+# Update intervals (seconds): poll fast while the output is on,
+# back off while the supply sits idle
+UPDATE_INTERVAL = 2
+UPDATE_INTERVAL_IDLE = 30
+
+# Upper bound on one full poll, including a reconnect (seconds)
+POLL_TIMEOUT = 15
+
+# Debounce cooldowns (seconds)
+REQUEST_REFRESH_COOLDOWN = 0.35
+SETPOINT_DEBOUNCE_COOLDOWN = 0.35
 
 # Device info
 MANUFACTURER = "Ruideng"
 MODEL = "RK6006"
+
+# BLE UART service advertised by the RK6006
+UART_SERVICE_UUID = "0000ffe0-0000-1000-8000-00805f9b34fb"
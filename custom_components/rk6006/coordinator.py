@@ -2,20 +2,72 @@
 from __future__ import annotations
 
 import asyncio
+from dataclasses import asdict, dataclass, replace
 from datetime import timedelta
+from functools import cached_property
 import logging
+import math
+from typing import Any
+
+from bleak import BleakError
 
 from homeassistant.components import bluetooth
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ADDRESS
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN, UPDATE_INTERVAL, CONF_CONNECTION_ENABLED
+from .const import (
+    CONF_CONNECTION_ENABLED,
+    DOMAIN,
+    MANUFACTURER,
+    MODEL,
+    POLL_TIMEOUT,
+    REQUEST_REFRESH_COOLDOWN,
+    SETPOINT_DEBOUNCE_COOLDOWN,
+    UPDATE_INTERVAL,
+    UPDATE_INTERVAL_IDLE,
+)
 from .rk6006 import RK6006
 
 _LOGGER = logging.getLogger(__name__)
 
+# Protection register value -> status string
+PROTECTION_STATES = {0: "none", 1: "ovp", 2: "ocp"}
+
+
+@dataclass(frozen=True, slots=True)
+class RK6006State:
+    """Snapshot of the RK6006 state, one instance per poll."""
+
+    voltage: float
+    current: float
+    power: float
+    voltage_set: float
+    current_set: float
+    temp_internal: float
+    temp_external: float | None
+    input_voltage: float
+    ovp: float
+    ocp: float
+    protection_status: str
+    ovp_triggered: bool
+    ocp_triggered: bool
+    amp_hours: float
+    watt_hours: float
+    backlight: int
+    output_enabled: bool
+    output_mode: str
+    buzzer: bool
+    power_on_boot: bool
+    take_out: bool
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the state as a plain dict (for diagnostics/logging)."""
+        return asdict(self)
+
 
 class RK6006Coordinator(DataUpdateCoordinator):
     """Class to manage fetching RK6006 data."""
@@ -26,16 +78,43 @@ class RK6006Coordinator(DataUpdateCoordinator):
         self.address = entry.data[CONF_ADDRESS]
         self.device = RK6006(self.address)
         self._connected = False
+        # Serializes connect/disconnect and device I/O so a reconnect or
+        # user write can't interleave with a poll in progress
+        self._io_lock = asyncio.Lock()
         # Read connection enabled state from config entry, default to True for backward compatibility
         self._connection_enabled = entry.data.get(CONF_CONNECTION_ENABLED, True)
         self._consecutive_errors = 0
         self._max_consecutive_errors = 3  # Allow 3 failures before marking unavailable
-        
+
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=UPDATE_INTERVAL),
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=REQUEST_REFRESH_COOLDOWN, immediate=False
+            ),
+            # Skip listener fan-out when a poll returns unchanged data
+            always_update=False,
+        )
+
+        # Debounce rapid setpoint changes (e.g. slider drags) into one
+        # BLE write carrying the latest pending value
+        self._pending_voltage: float | None = None
+        self._pending_current: float | None = None
+        self._voltage_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=SETPOINT_DEBOUNCE_COOLDOWN,
+            immediate=True,
+            function=self._async_write_voltage,
+        )
+        self._current_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=SETPOINT_DEBOUNCE_COOLDOWN,
+            immediate=True,
+            function=self._async_write_current,
         )
 
     async def _async_update_data(self):
@@ -45,57 +124,37 @@ class RK6006Coordinator(DataUpdateCoordinator):
             raise UpdateFailed("Connection is disabled")
         
         try:
-            if not self._connected:
-                _LOGGER.info("Connecting to RK6006 at %s", self.address)
-                await self.device.connect()
-                self._connected = True
-                _LOGGER.info("Successfully connected to RK6006")
-            
-            # Fetch all data
-            _LOGGER.debug("Fetching status data")
-            status = await self.device.get_status()
-            settings = await self.device.get_settings()
-            temps = await self.device.get_temperature()
-            input_v = await self.device.get_input_voltage()
-            protection = await self.device.get_protection_settings()
-            protection_status = await self.device.get_protection_status()
-            energy = await self.device.get_energy_counters()
-            backlight = await self.device.get_backlight()
-            
-            # Get output state and additional settings
-            output_state = await self.device.read_register(self.device.REG_OUTPUT_STATE)
-            output_mode = await self.device.get_output_mode()
-            buzzer = await self.device.get_buzzer()
-            power_on_boot = await self.device.get_power_on_boot()
-            take_out = await self.device.get_take_out()
-            
+            # Bound the whole poll so a hung BLE read can't freeze the
+            # coordinator; a timeout counts as a regular failure below
+            async with asyncio.timeout(POLL_TIMEOUT), self._io_lock:
+                if not self._connected:
+                    _LOGGER.info("Connecting to RK6006 at %s", self.address)
+                    await self.device.connect()
+                    self._connected = True
+                    _LOGGER.info("Successfully connected to RK6006")
+
+                # Fetch all data in a few bulk multi-register reads instead
+                # of one BLE round-trip per value; decoding happens locally
+                # in _decode_state
+                _LOGGER.debug("Fetching status data")
+                raw = await self.device.read_all()
+
             # Reset error counter on success
             self._consecutive_errors = 0
-            
-            data = {
-                "voltage": status["voltage"],
-                "current": status["current"],
-                "power": status["power"],
-                "voltage_set": settings["voltage_set"],
-                "current_set": settings["current_set"],
-                "temp_internal": temps["internal"],
-                "temp_external": temps["external"],
-                "input_voltage": input_v,
-                "ovp": protection["ovp"],
-                "ocp": protection["ocp"],
-                "protection_status": protection_status["status"],
-                "ovp_triggered": protection_status["ovp_triggered"],
-                "ocp_triggered": protection_status["ocp_triggered"],
-                "amp_hours": energy["amp_hours"],
-                "watt_hours": energy["watt_hours"],
-                "backlight": backlight,
-                "output_enabled": bool(output_state),
-                "output_mode": output_mode,
-                "buzzer": buzzer,
-                "power_on_boot": power_on_boot,
-                "take_out": take_out,
-            }
-            
+
+            data = self._decode_state(raw)
+            # Reuse the previous snapshot when nothing changed so idle polls
+            # don't keep a new record alive per cycle
+            if data == self.data:
+                data = self.data
+
+            # Poll fast while the output is on, back off while idle
+            new_interval = timedelta(
+                seconds=UPDATE_INTERVAL if data.output_enabled else UPDATE_INTERVAL_IDLE
+            )
+            if self.update_interval != new_interval:
+                self.update_interval = new_interval
+
             _LOGGER.debug("Successfully fetched data: %s", data)
             return data
             
@@ -116,118 +175,235 @@ class RK6006Coordinator(DataUpdateCoordinator):
                 raise UpdateFailed(f"Failed to communicate after {self._consecutive_errors} attempts") from err
             
             # Return last known data to keep entities available
-            return self.data if self.data else {}
+            return self.data
+
+    def _decode_state(self, raw: dict[int, int]) -> RK6006State:
+        """Decode a raw register map from read_all into an RK6006State."""
+        dev = self.device
+        # The original get_temperature() read the external probe from the
+        # register right after REG_TEMP_INT (0x06), even though the
+        # REG_TEMP_EXT constant says 0x04; keep the original register
+        # here until that discrepancy is settled against hardware
+        ext_temp = raw[dev.REG_TEMP_INT + 1]
+        prot_status = raw[dev.REG_PROTECTION]
+        return RK6006State(
+            voltage=raw[dev.REG_VOLTAGE_READ] / 100.0,
+            current=raw[dev.REG_CURRENT_READ] / 1000.0,
+            power=((raw[dev.REG_POWER_H] << 16) | raw[dev.REG_POWER_L]) / 100.0,
+            voltage_set=raw[dev.REG_VOLTAGE_SET] / 100.0,
+            current_set=raw[dev.REG_CURRENT_SET] / 1000.0,
+            temp_internal=float(raw[dev.REG_TEMP_INT]),
+            # External temp shows 65535 if no probe connected
+            temp_external=float(ext_temp) if ext_temp < 65000 else None,
+            input_voltage=raw[dev.REG_INPUT_VOLTAGE] / 100.0,
+            ovp=raw[dev.REG_OVP] / 100.0,
+            ocp=raw[dev.REG_OCP] / 1000.0,
+            protection_status=PROTECTION_STATES.get(prot_status, "unknown"),
+            ovp_triggered=prot_status == 1,
+            ocp_triggered=prot_status == 2,
+            amp_hours=((raw[dev.REG_AH_H] << 16) | raw[dev.REG_AH_L]) / 1000.0,
+            watt_hours=((raw[dev.REG_WH_H] << 16) | raw[dev.REG_WH_L]) / 1000.0,
+            backlight=raw[dev.REG_BACKLIGHT],
+            output_enabled=bool(raw[dev.REG_OUTPUT_STATE]),
+            output_mode="CC" if raw[dev.REG_OUTPUT_MODE] == 1 else "CV",
+            buzzer=bool(raw[dev.REG_BUZZER]),
+            power_on_boot=bool(raw[dev.REG_POWER_ON_BOOT]),
+            take_out=bool(raw[dev.REG_TAKE_OUT]),
+        )
 
     async def async_shutdown(self) -> None:
         """Shutdown the coordinator."""
         if self._connected:
-            try:
-                await self.device.disconnect()
-            except Exception:
-                pass
-            self._connected = False
+            async with self._io_lock:
+                try:
+                    await self.device.disconnect()
+                except (BleakError, asyncio.TimeoutError, OSError):
+                    pass
+                self._connected = False
 
     async def async_set_voltage(self, voltage: float) -> None:
-        """Set output voltage."""
-        await self.device.set_voltage(voltage)
+        """Set output voltage (debounced so rapid changes coalesce)."""
+        # Skip no-op resends (tolerance is half the 0.01 V register step)
+        if self.data and math.isclose(self.data.voltage_set, voltage, abs_tol=0.005):
+            return
+        self._pending_voltage = voltage
         # Update the data directly without triggering unavailable state
         if self.data:
-            self.data["voltage_set"] = voltage
-            self.async_set_updated_data(self.data)
+            self.async_set_updated_data(replace(self.data, voltage_set=voltage))
+        await self._voltage_debouncer.async_call()
+
+    async def _async_write_voltage(self) -> None:
+        """Write the latest pending voltage setpoint to the device."""
+        if self._pending_voltage is not None:
+            async with self._io_lock:
+                await self.device.set_voltage(self._pending_voltage)
 
     async def async_set_current(self, current: float) -> None:
-        """Set output current."""
-        await self.device.set_current(current)
+        """Set output current (debounced so rapid changes coalesce)."""
+        # Skip no-op resends (tolerance is half the 0.001 A register step)
+        if self.data and math.isclose(self.data.current_set, current, abs_tol=0.0005):
+            return
+        self._pending_current = current
         # Update the data directly without triggering unavailable state
         if self.data:
-            self.data["current_set"] = current
-            self.async_set_updated_data(self.data)
+            self.async_set_updated_data(replace(self.data, current_set=current))
+        await self._current_debouncer.async_call()
+
+    async def _async_write_current(self) -> None:
+        """Write the latest pending current setpoint to the device."""
+        if self._pending_current is not None:
+            async with self._io_lock:
+                await self.device.set_current(self._pending_current)
 
     async def async_set_ovp(self, voltage: float) -> None:
         """Set over-voltage protection."""
-        await self.device.set_ovp(voltage)
+        if self.data and math.isclose(self.data.ovp, voltage, abs_tol=0.005):
+            return
+        async with self._io_lock:
+            await self.device.set_ovp(voltage)
         # Update the data directly without triggering unavailable state
         if self.data:
-            self.data["ovp"] = voltage
-            self.async_set_updated_data(self.data)
+            self.async_set_updated_data(replace(self.data, ovp=voltage))
 
     async def async_set_ocp(self, current: float) -> None:
         """Set over-current protection."""
-        await self.device.set_ocp(current)
+        if self.data and math.isclose(self.data.ocp, current, abs_tol=0.0005):
+            return
+        async with self._io_lock:
+            await self.device.set_ocp(current)
         # Update the data directly without triggering unavailable state
         if self.data:
-            self.data["ocp"] = current
-            self.async_set_updated_data(self.data)
+            self.async_set_updated_data(replace(self.data, ocp=current))
 
     async def async_set_backlight(self, level: int) -> None:
         """Set backlight level."""
-        await self.device.set_backlight(level)
+        if self.data and self.data.backlight == level:
+            return
+        async with self._io_lock:
+            await self.device.set_backlight(level)
         # Update the data directly without triggering unavailable state
         if self.data:
-            self.data["backlight"] = level
-            self.async_set_updated_data(self.data)
+            self.async_set_updated_data(replace(self.data, backlight=level))
 
     async def async_set_output(self, state: bool) -> None:
         """Turn output on or off."""
-        await self.device.set_output(state)
-        # Update the data directly without triggering unavailable state
-        if self.data:
-            self.data["output_enabled"] = state
-            self.async_set_updated_data(self.data)
+        if self.data and self.data.output_enabled == state:
+            return
+        # Optimistic: reflect the new state immediately so the UI does not
+        # lag behind the BLE round-trip; revert if the write fails
+        previous = self.data
+        previous_interval = self.update_interval
+        # Switch the polling cadence before pushing data: the push below
+        # reschedules the next refresh and must pick up the new interval
+        new_interval = timedelta(
+            seconds=UPDATE_INTERVAL if state else UPDATE_INTERVAL_IDLE
+        )
+        if self.update_interval != new_interval:
+            self.update_interval = new_interval
+        if previous:
+            self.async_set_updated_data(replace(previous, output_enabled=state))
+        try:
+            async with self._io_lock:
+                await self.device.set_output(state)
+        except Exception:
+            self.update_interval = previous_interval
+            if previous:
+                self.async_set_updated_data(previous)
+            raise
 
     async def async_set_buzzer(self, state: bool) -> None:
         """Enable or disable buzzer."""
-        await self.device.set_buzzer(state)
-        # Update the data directly without triggering unavailable state
-        if self.data:
-            self.data["buzzer"] = state
-            self.async_set_updated_data(self.data)
+        if self.data and self.data.buzzer == state:
+            return
+        # Optimistic: reflect the new state immediately so the UI does not
+        # lag behind the BLE round-trip; revert if the write fails
+        previous = self.data
+        if previous:
+            self.async_set_updated_data(replace(previous, buzzer=state))
+        try:
+            async with self._io_lock:
+                await self.device.set_buzzer(state)
+        except Exception:
+            if previous:
+                self.async_set_updated_data(previous)
+            raise
 
     async def async_set_power_on_boot(self, state: bool) -> None:
         """Enable or disable power on boot."""
-        await self.device.set_power_on_boot(state)
-        # Update the data directly without triggering unavailable state
-        if self.data:
-            self.data["power_on_boot"] = state
-            self.async_set_updated_data(self.data)
+        if self.data and self.data.power_on_boot == state:
+            return
+        # Optimistic: reflect the new state immediately so the UI does not
+        # lag behind the BLE round-trip; revert if the write fails
+        previous = self.data
+        if previous:
+            self.async_set_updated_data(replace(previous, power_on_boot=state))
+        try:
+            async with self._io_lock:
+                await self.device.set_power_on_boot(state)
+        except Exception:
+            if previous:
+                self.async_set_updated_data(previous)
+            raise
 
     async def async_set_take_out(self, state: bool) -> None:
         """Enable or disable take out."""
-        await self.device.set_take_out(state)
-        # Update the data directly without triggering unavailable state
-        if self.data:
-            self.data["take_out"] = state
-            self.async_set_updated_data(self.data)
+        if self.data and self.data.take_out == state:
+            return
+        # Optimistic: reflect the new state immediately so the UI does not
+        # lag behind the BLE round-trip; revert if the write fails
+        previous = self.data
+        if previous:
+            self.async_set_updated_data(replace(previous, take_out=state))
+        try:
+            async with self._io_lock:
+                await self.device.set_take_out(state)
+        except Exception:
+            if previous:
+                self.async_set_updated_data(previous)
+            raise
 
     async def async_enable_connection(self) -> None:
         """Enable connection to device."""
         self._connection_enabled = True
         self._consecutive_errors = 0  # Reset error counter when re-enabling
-        
-        # Persist state to config entry
-        new_data = dict(self.entry.data)
-        new_data[CONF_CONNECTION_ENABLED] = True
-        self.hass.config_entries.async_update_entry(self.entry, data=new_data)
-        
+
+        # Persist state to config entry, skipping the disk write if unchanged
+        if not self.entry.data.get(CONF_CONNECTION_ENABLED, True):
+            new_data = dict(self.entry.data)
+            new_data[CONF_CONNECTION_ENABLED] = True
+            self.hass.config_entries.async_update_entry(self.entry, data=new_data)
+
         await self.async_request_refresh()
 
     async def async_disable_connection(self) -> None:
         """Disable connection to device."""
         self._connection_enabled = False
-        
-        # Persist state to config entry
-        new_data = dict(self.entry.data)
-        new_data[CONF_CONNECTION_ENABLED] = False
-        self.hass.config_entries.async_update_entry(self.entry, data=new_data)
+
+        # Persist state to config entry, skipping the disk write if unchanged
+        if self.entry.data.get(CONF_CONNECTION_ENABLED, True):
+            new_data = dict(self.entry.data)
+            new_data[CONF_CONNECTION_ENABLED] = False
+            self.hass.config_entries.async_update_entry(self.entry, data=new_data)
         
         if self._connected:
-            try:
-                await self.device.disconnect()
-            except Exception:
-                pass
-            self._connected = False
+            async with self._io_lock:
+                try:
+                    await self.device.disconnect()
+                except (BleakError, asyncio.TimeoutError, OSError):
+                    pass
+                self._connected = False
 
     @property
     def connection_enabled(self) -> bool:
         """Return if connection is enabled."""
         return self._connection_enabled
+
+    @cached_property
+    def device_info(self) -> DeviceInfo:
+        """Return device info shared by all entities of this coordinator."""
+        return DeviceInfo(
+            identifiers=frozenset({(DOMAIN, self.address)}),
+            name="RK6006 Power Supply",
+            manufacturer=MANUFACTURER,
+            model=MODEL,
+        )
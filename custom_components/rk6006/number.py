@@ -11,7 +11,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER, MODEL
+from .const import DOMAIN
 from .coordinator import RK6006Coordinator
 
 
@@ -37,28 +37,24 @@ async def async_setup_entry(
 class RK6006VoltageNumber(CoordinatorEntity, NumberEntity):
     """Voltage setpoint number entity."""
 
+    _attr_name = "RK6006 Voltage Setpoint"
+    _attr_native_unit_of_measurement = UnitOfElectricPotential.VOLT
+    _attr_icon = "mdi:lightning-bolt"
+    _attr_native_min_value = 0
+    _attr_native_max_value = 60
+    _attr_native_step = 0.01
+    _attr_mode = NumberMode.BOX
+
     def __init__(self, coordinator: RK6006Coordinator) -> None:
         """Initialize the number."""
         super().__init__(coordinator)
-        self._attr_name = "RK6006 Voltage Setpoint"
         self._attr_unique_id = f"{coordinator.address}_voltage_set"
-        self._attr_native_unit_of_measurement = UnitOfElectricPotential.VOLT
-        self._attr_icon = "mdi:lightning-bolt"
-        self._attr_native_min_value = 0
-        self._attr_native_max_value = 60
-        self._attr_native_step = 0.01
-        self._attr_mode = NumberMode.BOX
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.address)},
-            "name": "RK6006 Power Supply",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> float:
         """Return the current value."""
-        return self.coordinator.data.get("voltage_set", 0)
+        return data.voltage_set if (data := self.coordinator.data) else 0
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new value."""
@@ -68,28 +64,24 @@ class RK6006VoltageNumber(CoordinatorEntity, NumberEntity):
 class RK6006CurrentNumber(CoordinatorEntity, NumberEntity):
     """Current setpoint number entity."""
 
+    _attr_name = "RK6006 Current Setpoint"
+    _attr_native_unit_of_measurement = UnitOfElectricCurrent.AMPERE
+    _attr_icon = "mdi:current-dc"
+    _attr_native_min_value = 0
+    _attr_native_max_value = 6
+    _attr_native_step = 0.001
+    _attr_mode = NumberMode.BOX
+
     def __init__(self, coordinator: RK6006Coordinator) -> None:
         """Initialize the number."""
         super().__init__(coordinator)
-        self._attr_name = "RK6006 Current Setpoint"
         self._attr_unique_id = f"{coordinator.address}_current_set"
-        self._attr_native_unit_of_measurement = UnitOfElectricCurrent.AMPERE
-        self._attr_icon = "mdi:current-dc"
-        self._attr_native_min_value = 0
-        self._attr_native_max_value = 6
-        self._attr_native_step = 0.001
-        self._attr_mode = NumberMode.BOX
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.address)},
-            "name": "RK6006 Power Supply",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> float:
         """Return the current value."""
-        return self.coordinator.data.get("current_set", 0)
+        return data.current_set if (data := self.coordinator.data) else 0
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new value."""
@@ -99,27 +91,23 @@ class RK6006CurrentNumber(CoordinatorEntity, NumberEntity):
 class RK6006OVPNumber(CoordinatorEntity, NumberEntity):
     """Over-voltage protection number entity."""
 
+    _attr_name = "RK6006 OVP"
+    _attr_native_unit_of_measurement = UnitOfElectricPotential.VOLT
+    _attr_native_min_value = 0
+    _attr_native_max_value = 65
+    _attr_native_step = 0.01
+    _attr_mode = NumberMode.BOX
+
     def __init__(self, coordinator: RK6006Coordinator) -> None:
         """Initialize the number."""
         super().__init__(coordinator)
-        self._attr_name = "RK6006 OVP"
         self._attr_unique_id = f"{coordinator.address}_ovp"
-        self._attr_native_unit_of_measurement = UnitOfElectricPotential.VOLT
-        self._attr_native_min_value = 0
-        self._attr_native_max_value = 65
-        self._attr_native_step = 0.01
-        self._attr_mode = NumberMode.BOX
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.address)},
-            "name": "RK6006 Power Supply",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> float:
         """Return the current value."""
-        return self.coordinator.data.get("ovp", 0)
+        return data.ovp if (data := self.coordinator.data) else 0
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new value."""
@@ -129,27 +117,23 @@ class RK6006OVPNumber(CoordinatorEntity, NumberEntity):
 class RK6006OCPNumber(CoordinatorEntity, NumberEntity):
     """Over-current protection number entity."""
 
+    _attr_name = "RK6006 OCP"
+    _attr_native_unit_of_measurement = UnitOfElectricCurrent.AMPERE
+    _attr_native_min_value = 0
+    _attr_native_max_value = 6.2
+    _attr_native_step = 0.001
+    _attr_mode = NumberMode.BOX
+
     def __init__(self, coordinator: RK6006Coordinator) -> None:
         """Initialize the number."""
         super().__init__(coordinator)
-        self._attr_name = "RK6006 OCP"
         self._attr_unique_id = f"{coordinator.address}_ocp"
-        self._attr_native_unit_of_measurement = UnitOfElectricCurrent.AMPERE
-        self._attr_native_min_value = 0
-        self._attr_native_max_value = 6.2
-        self._attr_native_step = 0.001
-        self._attr_mode = NumberMode.BOX
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.address)},
-            "name": "RK6006 Power Supply",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> float:
         """Return the current value."""
-        return self.coordinator.data.get("ocp", 0)
+        return data.ocp if (data := self.coordinator.data) else 0
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new value."""
@@ -159,27 +143,23 @@ class RK6006OCPNumber(CoordinatorEntity, NumberEntity):
 class RK6006BacklightNumber(CoordinatorEntity, NumberEntity):
     """Backlight number entity."""
 
+    _attr_name = "RK6006 Backlight"
+    _attr_icon = "mdi:brightness-6"
+    _attr_native_min_value = 0
+    _attr_native_max_value = 5
+    _attr_native_step = 1
+    _attr_mode = NumberMode.SLIDER
+
     def __init__(self, coordinator: RK6006Coordinator) -> None:
         """Initialize the number."""
         super().__init__(coordinator)
-        self._attr_name = "RK6006 Backlight"
         self._attr_unique_id = f"{coordinator.address}_backlight"
-        self._attr_icon = "mdi:brightness-6"
-        self._attr_native_min_value = 0
-        self._attr_native_max_value = 5
-        self._attr_native_step = 1
-        self._attr_mode = NumberMode.SLIDER
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.address)},
-            "name": "RK6006 Power Supply",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> int:
         """Return the current value."""
-        return self.coordinator.data.get("backlight", 5)
+        return data.backlight if (data := self.coordinator.data) else 5
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new value."""
@@ -13,12 +13,81 @@ Install with: pip install bleak pymodbus
 """
 
 import asyncio
+import logging
 import struct
-from bleak import BleakClient, BleakScanner
+import time
+from functools import lru_cache
+from bleak import BleakClient, BleakError, BleakScanner
 from bleak.backends.device import BLEDevice
 from bleak_retry_connector import establish_connection
 from typing import Optional
 
+_LOGGER = logging.getLogger(__name__)
+
+
+def _generate_crc16_table() -> tuple[int, ...]:
+    """Generate the Modbus CRC16 lookup table (polynomial 0xA001)"""
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            if crc & 0x0001:
+                crc = (crc >> 1) ^ 0xA001
+            else:
+                crc >>= 1
+        table.append(crc)
+    return tuple(table)
+
+
+_CRC16_TABLE = _generate_crc16_table()
+
+try:
+    # Use crcmod's C implementation when it's available; fall back to the
+    # pure-Python table loop otherwise
+    from crcmod.predefined import mkPredefinedCrcFun
+
+    _modbus_crc = mkPredefinedCrcFun("modbus")
+except ImportError:
+    _modbus_crc = None
+
+
+def _calculate_crc16(data: bytes) -> int:
+    """Calculate Modbus CRC16"""
+    if _modbus_crc is not None:
+        return _modbus_crc(data)
+    crc = 0xFFFF
+    table = _CRC16_TABLE
+    for byte in data:
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+    return crc
+
+
+# Pre-compiled struct formats: skips the format-string parse per frame
+_CMD_STRUCT = struct.Struct('>BBHH')
+_CRC_STRUCT = struct.Struct('<H')
+_WRITE_MULTI_HEADER = struct.Struct('>BBHHB')
+
+
+@lru_cache(maxsize=256)
+def _build_modbus_command(slave_id: int, function: int,
+                          register: int, value: int) -> bytes:
+    """Build a Modbus RTU command
+
+    Cached: the coordinator polls the same frames every cycle, and the
+    resulting bytes are immutable.
+    """
+    data = _CMD_STRUCT.pack(slave_id, function, register, value)
+    return data + _CRC_STRUCT.pack(_calculate_crc16(data))
+
+
+def _build_modbus_write_multi(slave_id: int, register: int,
+                              values: tuple[int, ...]) -> bytes:
+    """Build a Modbus RTU Write Multiple Registers (0x10) command"""
+    count = len(values)
+    data = _WRITE_MULTI_HEADER.pack(slave_id, 0x10, register, count, count * 2)
+    data += struct.pack(f'>{count}H', *values)
+    return data + _CRC_STRUCT.pack(_calculate_crc16(data))
+
 
 class RK6006:
     """Controller for RK6006 Power Supply via Bluetooth"""
@@ -73,62 +142,57 @@ class RK6006:
     
     # Memory slots (M0-M9, each uses 4 registers: V, I, OVP, OCP)
     REG_MEMORY_BASE = 0x0050   # Memory slot base (M0 at 0x50-0x53)
+    # Base address per slot (REG_MEMORY_BASE + slot * 4), precomputed
+    _MEMORY_SLOT_BASES = tuple(0x0050 + i * 4 for i in range(10))
     
     # Bluetooth UUIDs (common for RK6006)
     UART_SERVICE_UUID = "0000ffe0-0000-1000-8000-00805f9b34fb"
     UART_TX_CHAR_UUID = "0000ffe1-0000-1000-8000-00805f9b34fb"
     UART_RX_CHAR_UUID = "0000ffe1-0000-1000-8000-00805f9b34fb"
     
-    def __init__(self, device_address: Optional[str] = None):
+    def __init__(self, device_address: Optional[str] = None,
+                 command_interval: float = 0.005):
         """Initialize RK6006 controller
-        
+
         Args:
             device_address: Bluetooth MAC address of the device (optional)
+            command_interval: Minimum spacing between commands in seconds
         """
         self.device_address = device_address
+        self.command_interval = command_interval
         self.ble_device: Optional[BLEDevice] = None
         self.client: Optional[BleakClient] = None
-        self.response_data = bytearray()
+        self._tx_char = None
+        self._write_without_response = False
+        # Fixed response buffer with a length cursor: avoids per-command
+        # reallocation (the largest frame we read is well under 256 bytes)
+        self._resp = bytearray(256)
+        self._resp_len = 0
         self.response_event = asyncio.Event()
+        self._expected_len: Optional[int] = None
+        self._command_lock = asyncio.Lock()
+        self._last_command_time = 0.0
         
-    def _calculate_crc16(self, data: bytes) -> int:
-        """Calculate Modbus CRC16"""
-        crc = 0xFFFF
-        for byte in data:
-            crc ^= byte
-            for _ in range(8):
-                if crc & 0x0001:
-                    crc = (crc >> 1) ^ 0xA001
-                else:
-                    crc >>= 1
-        return crc
-    
-    def _build_modbus_command(self, slave_id: int, function: int, 
-                             register: int, value: int) -> bytes:
-        """Build a Modbus RTU command"""
-        data = struct.pack('>BBHH', slave_id, function, register, value)
-        crc = self._calculate_crc16(data)
-        return data + struct.pack('<H', crc)
-    
     def _notification_handler(self, sender, data: bytearray):
         """Handle incoming Bluetooth notifications"""
-        self.response_data.extend(data)
-        # Check if we have a complete Modbus response
-        # Read response: min 5 bytes [slave][func][len][data...][crc]
-        # Write response: min 8 bytes [slave][func][addr_h][addr_l][val_h][val_l][crc_l][crc_h]
-        if len(self.response_data) >= 5:
-            func = self.response_data[1] if len(self.response_data) > 1 else 0
-            if func == 0x03:  # Read response
-                byte_count = self.response_data[2] if len(self.response_data) > 2 else 0
-                expected_len = 5 + byte_count  # slave + func + len + data + 2-byte CRC
-                if len(self.response_data) >= expected_len:
-                    self.response_event.set()
-            elif func == 0x06:  # Write response
-                if len(self.response_data) >= 8:
-                    self.response_event.set()
+        n = len(data)
+        self._resp[self._resp_len:self._resp_len + n] = data
+        self._resp_len += n
+        # Determine the frame length once from the header, then just wait
+        # for enough bytes to arrive (BLE delivers 20-byte fragments)
+        if self._expected_len is None and self._resp_len >= 3:
+            func = self._resp[1]
+            if func == 0x03:
+                # Read response: [slave][func][len][data...][crc] = 5 + len
+                self._expected_len = 5 + self._resp[2]
+            elif func in (0x06, 0x10):
+                # Write echo: [slave][func][addr][value/count][crc] = 8
+                self._expected_len = 8
             else:
-                # Unknown response, set event anyway
-                self.response_event.set()
+                # Unknown/exception response, signal with what we have
+                self._expected_len = self._resp_len
+        if self._expected_len is not None and self._resp_len >= self._expected_len:
+            self.response_event.set()
     
     async def scan_devices(self, timeout: float = 10.0):
         """Scan for RK6006 devices
@@ -139,52 +203,51 @@ class RK6006:
         Returns:
             List of discovered devices
         """
-        print(f"Scanning for Bluetooth devices for {timeout} seconds...")
+        _LOGGER.debug("Scanning for Bluetooth devices for %s seconds", timeout)
         devices = await BleakScanner.discover(timeout=timeout, return_adv=True)
         
-        SERVICE_UUID = "0000ffe0-0000-1000-8000-00805f9b34fb"
         rk_devices = []
         for device, adv_data in devices.values():
-            # Match by service UUID or by name if available
-            if SERVICE_UUID in adv_data.service_uuids or (device.name and "RK" in device.name.upper()):
+            # Match by service UUID or by a known model-name prefix
+            if self.UART_SERVICE_UUID in adv_data.service_uuids or (
+                device.name and device.name.upper().startswith("RK")
+            ):
                 rk_devices.append(device)
-                print(f"Found: {device.name or 'RK6006'} ({device.address})")
+                _LOGGER.debug("Found: %s (%s)", device.name or "RK6006", device.address)
         
         return rk_devices
     
     async def connect(self, timeout: float = 10.0):
         """Connect to the RK6006 device"""
         if not self.ble_device:
-            # Need to scan for the device first
-            print(f"Scanning for Bluetooth devices for {timeout} seconds...")
-            devices = await BleakScanner.discover(timeout=timeout, return_adv=True)
-            
-            # Filter for devices with the RK6006 service UUID or match by address
-            SERVICE_UUID = "0000ffe0-0000-1000-8000-00805f9b34fb"
-            
-            target_device = None
-            for device, adv_data in devices.values():
-                # Match by address (preferred) or by service UUID
-                if self.device_address:
-                    if device.address == self.device_address:
+            if self.device_address:
+                # Known address: targeted lookup returns as soon as the
+                # device advertises instead of a full discovery sweep
+                target_device = await BleakScanner.find_device_by_address(
+                    self.device_address, timeout=timeout
+                )
+                if not target_device:
+                    raise Exception(f"RK6006 device with address {self.device_address} not found")
+            else:
+                # Need to scan for the device first
+                _LOGGER.debug("Scanning for Bluetooth devices for %s seconds", timeout)
+                devices = await BleakScanner.discover(timeout=timeout, return_adv=True)
+
+                # Filter for devices with the RK6006 service UUID
+                target_device = None
+                for device, adv_data in devices.values():
+                    if self.UART_SERVICE_UUID in adv_data.service_uuids:
                         target_device = device
-                        break
-                elif SERVICE_UUID in adv_data.service_uuids:
-                    target_device = device
-                    if not self.device_address:
                         self.device_address = device.address
-                    break
-            
-            if not target_device:
-                if self.device_address:
-                    raise Exception(f"RK6006 device with address {self.device_address} not found")
-                else:
+                        break
+
+                if not target_device:
                     raise Exception("No RK6006 devices found")
-            
+
             self.ble_device = target_device
-            print(f"Using device: {self.ble_device.name or 'RK6006'} ({self.device_address})")
+            _LOGGER.debug("Using device: %s (%s)", self.ble_device.name or "RK6006", self.device_address)
         
-        print(f"Connecting to {self.device_address}...")
+        _LOGGER.debug("Connecting to %s", self.device_address)
         self.client = await establish_connection(
             BleakClient,
             self.ble_device,
@@ -192,38 +255,75 @@ class RK6006:
             disconnected_callback=lambda client: None,
         )
         
+        # Best effort: nudge the backend to negotiate a larger ATT MTU so
+        # batched multi-register responses fit in a single notification.
+        # BlueZ only learns the MTU lazily; other backends negotiate it
+        # during connect already.
+        try:
+            acquire_mtu = getattr(self.client._backend, "_acquire_mtu", None)
+            if acquire_mtu is not None:
+                await acquire_mtu()
+        except (BleakError, NotImplementedError, OSError):
+            pass
+
         # Start notifications
         await self.client.start_notify(
-            self.UART_RX_CHAR_UUID, 
+            self.UART_RX_CHAR_UUID,
             self._notification_handler
         )
-        print("Connected successfully!")
+        # Resolve the TX characteristic once so each write skips bleak's
+        # per-call UUID lookup
+        self._tx_char = self.client.services.get_characteristic(
+            self.UART_TX_CHAR_UUID
+        )
+        # The Modbus reply comes via notify, so skip the ATT write ack
+        # round-trip when the characteristic allows it
+        self._write_without_response = bool(
+            self._tx_char
+            and "write-without-response" in self._tx_char.properties
+        )
+        _LOGGER.debug("Connected successfully")
     
     async def disconnect(self):
         """Disconnect from the device"""
+        self._tx_char = None
+        self._write_without_response = False
         if self.client and self.client.is_connected:
             try:
                 await self.client.disconnect()
-                print("Disconnected")
-            except Exception:
+                _LOGGER.debug("Disconnected")
+            except (BleakError, asyncio.TimeoutError, OSError):
                 # Ignore disconnect errors
                 pass
     
     async def _send_command(self, command: bytes, timeout: float = 2.0) -> bytes:
         """Send a command and wait for response"""
-        self.response_data.clear()
-        self.response_event.clear()
-        
-        await self.client.write_gatt_char(self.UART_TX_CHAR_UUID, command)
-        
-        try:
-            await asyncio.wait_for(self.response_event.wait(), timeout=timeout)
-            response = bytes(self.response_data)
-            # Small delay between commands to prevent issues
-            await asyncio.sleep(0.05)
-            return response
-        except asyncio.TimeoutError:
-            raise Exception("Command timeout - no response received")
+        # Serialize commands so concurrent callers can't interleave
+        # requests/responses on the shared notify channel
+        async with self._command_lock:
+            # Pace back-to-back commands: only sleep the remaining time
+            # since the previous one instead of a fixed delay
+            wait = self.command_interval - (time.monotonic() - self._last_command_time)
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            self._resp_len = 0
+            self.response_event.clear()
+            self._expected_len = None
+
+            await self.client.write_gatt_char(
+                self._tx_char or self.UART_TX_CHAR_UUID,
+                command,
+                response=not self._write_without_response,
+            )
+
+            try:
+                await asyncio.wait_for(self.response_event.wait(), timeout=timeout)
+                return bytes(self._resp[:self._resp_len])
+            except asyncio.TimeoutError:
+                raise Exception("Command timeout - no response received")
+            finally:
+                self._last_command_time = time.monotonic()
     
     async def read_register(self, register: int, count: int = 1, slave_id: int = 1):
         """Read register value(s)
@@ -236,7 +336,7 @@ class RK6006:
         Returns:
             Single value if count=1, list of values otherwise
         """
-        command = self._build_modbus_command(slave_id, 0x03, register, count)
+        command = _build_modbus_command(slave_id, 0x03, register, count)
         response = await self._send_command(command)
         
         if len(response) >= 5:
@@ -244,14 +344,36 @@ class RK6006:
             byte_count = response[2]
             expected_data = count * 2
             if byte_count == expected_data and len(response) >= 3 + byte_count + 2:
-                values = []
-                for i in range(count):
-                    offset = 3 + (i * 2)
-                    value = struct.unpack('>H', response[offset:offset+2])[0]
-                    values.append(value)
-                return values[0] if count == 1 else values
+                # One C call instead of a per-register unpack loop
+                values = struct.unpack_from(f'>{count}H', response, 3)
+                return values[0] if count == 1 else list(values)
         raise Exception(f"Invalid response: {response.hex()}")
     
+    async def read_all(self) -> dict:
+        """Read all registers needed for a status poll in bulk
+
+        Issues a few multi-register reads covering the monitoring block,
+        energy counters, misc settings and protection setpoints.
+
+        Returns:
+            Dictionary mapping register address to raw value
+        """
+        spans = (
+            (self.REG_TEMP_EXT, self.REG_OUTPUT_STATE - self.REG_TEMP_EXT + 1),
+            (self.REG_AH_H, 4),
+            (self.REG_TAKE_OUT, self.REG_BACKLIGHT - self.REG_TAKE_OUT + 1),
+            (self.REG_OVP, 2),
+        )
+        results = await asyncio.gather(
+            *(self.read_register(start, count) for start, count in spans)
+        )
+
+        registers = {}
+        for (start, _), values in zip(spans, results):
+            for offset, value in enumerate(values):
+                registers[start + offset] = value
+        return registers
+
     async def write_register(self, register: int, value: int, slave_id: int = 1):
         """Write a register value
         
@@ -260,9 +382,23 @@ class RK6006:
             value: Value to write
             slave_id: Modbus slave ID (default: 1)
         """
-        command = self._build_modbus_command(slave_id, 0x06, register, value)
+        command = _build_modbus_command(slave_id, 0x06, register, value)
         response = await self._send_command(command)
-        
+
+        if len(response) < 8:
+            raise Exception("Invalid response")
+
+    async def write_registers(self, register: int, values, slave_id: int = 1):
+        """Write several consecutive registers in one transaction
+
+        Args:
+            register: Starting register address
+            values: Values to write to consecutive registers
+            slave_id: Modbus slave ID (default: 1)
+        """
+        command = _build_modbus_write_multi(slave_id, register, tuple(values))
+        response = await self._send_command(command)
+
         if len(response) < 8:
             raise Exception("Invalid response")
     
@@ -510,16 +646,21 @@ class RK6006:
             ovp = ovp if ovp is not None else protection['ovp']
             ocp = ocp if ocp is not None else protection['ocp']
         
-        # Memory slots are at 0x50 + (slot * 4)
-        base_addr = self.REG_MEMORY_BASE + (slot * 4)
-        
-        await self.write_register(base_addr, int(voltage * 100))
-        await self.write_register(base_addr + 1, int(current * 1000))
-        await self.write_register(base_addr + 2, int(ovp * 100))
-        await self.write_register(base_addr + 3, int(ocp * 1000))
-        
-        print(f"Saved to memory M{slot}: {voltage:.2f}V, {current:.3f}A, "
-              f"OVP={ovp:.2f}V, OCP={ocp:.3f}A")
+        # Memory slots are at 0x50 + (slot * 4); write all four registers
+        # in a single Modbus transaction
+        base_addr = self._MEMORY_SLOT_BASES[slot]
+
+        await self.write_registers(base_addr, (
+            int(voltage * 100),
+            int(current * 1000),
+            int(ovp * 100),
+            int(ocp * 1000),
+        ))
+
+        _LOGGER.debug(
+            "Saved to memory M%s: %.2fV, %.3fA, OVP=%.2fV, OCP=%.3fA",
+            slot, voltage, current, ovp, ocp,
+        )
     
     async def recall_memory(self, slot: int, apply: bool = True) -> dict:
         """Recall settings from a memory slot
@@ -534,7 +675,7 @@ class RK6006:
         if not 0 <= slot <= 9:
             raise ValueError("Memory slot must be 0-9")
         
-        base_addr = self.REG_MEMORY_BASE + (slot * 4)
+        base_addr = self._MEMORY_SLOT_BASES[slot]
         values = await self.read_register(base_addr, 4)
         
         settings = {
@@ -545,13 +686,19 @@ class RK6006:
         }
         
         if apply:
-            await self.set_voltage(settings['voltage'])
-            await self.set_current(settings['current'])
-            await self.set_ovp(settings['ovp'])
-            await self.set_ocp(settings['ocp'])
-            print(f"Recalled and applied memory M{slot}")
+            # Setpoints and protection limits are each contiguous pairs,
+            # so applying takes two transactions instead of four
+            await self.write_registers(self.REG_VOLTAGE_SET, (
+                int(settings['voltage'] * 100),
+                int(settings['current'] * 1000),
+            ))
+            await self.write_registers(self.REG_OVP, (
+                int(settings['ovp'] * 100),
+                int(settings['ocp'] * 1000),
+            ))
+            _LOGGER.debug("Recalled and applied memory M%s", slot)
         else:
-            print(f"Recalled memory M{slot} (not applied)")
+            _LOGGER.debug("Recalled memory M%s (not applied)", slot)
         
         return settings
     
@@ -568,7 +715,7 @@ class RK6006:
             await self.write_register(self.REG_BATTERY_VOLTAGE, int(voltage * 100))
         
         await self.write_register(self.REG_BATTERY_MODE, 1 if enabled else 0)
-        print(f"Battery mode {'enabled' if enabled else 'disabled'}")
+        _LOGGER.debug("Battery mode %s", "enabled" if enabled else "disabled")
     
     async def get_battery_mode(self) -> dict:
         """Get battery mode status
@@ -595,7 +742,7 @@ class RK6006:
             raise ValueError("Backlight level must be 0-5")
         
         await self.write_register(self.REG_BACKLIGHT, level)
-        print(f"Backlight set to level {level}")
+        _LOGGER.debug("Backlight set to level %s", level)
     
     async def get_backlight(self) -> int:
         """Get current backlight brightness level
@@ -614,7 +761,7 @@ class RK6006:
             enabled: True to enable buzzer, False to disable
         """
         await self.write_register(self.REG_BUZZER, 1 if enabled else 0)
-        print(f"Buzzer {'enabled' if enabled else 'disabled'}")
+        _LOGGER.debug("Buzzer %s", "enabled" if enabled else "disabled")
     
     async def get_buzzer(self) -> bool:
         """Get buzzer state
@@ -632,7 +779,7 @@ class RK6006:
             enabled: True to enable output on boot, False to disable
         """
         await self.write_register(self.REG_POWER_ON_BOOT, 1 if enabled else 0)
-        print(f"Power on boot {'enabled' if enabled else 'disabled'}")
+        _LOGGER.debug("Power on boot %s", "enabled" if enabled else "disabled")
     
     async def get_power_on_boot(self) -> bool:
         """Get power on boot state
@@ -650,7 +797,7 @@ class RK6006:
             enabled: True to enable take out, False to disable
         """
         await self.write_register(self.REG_TAKE_OUT, 1 if enabled else 0)
-        print(f"Take out {'enabled' if enabled else 'disabled'}")
+        _LOGGER.debug("Take out %s", "enabled" if enabled else "disabled")
     
     async def get_take_out(self) -> bool:
         """Get take out state
@@ -4,6 +4,7 @@ from __future__ import annotations
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
@@ -18,9 +19,69 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER, MODEL
+from .const import DOMAIN
 from .coordinator import RK6006Coordinator
 
+SENSOR_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = (
+    SensorEntityDescription(
+        key="voltage",
+        name="RK6006 Voltage",
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="current",
+        name="RK6006 Current",
+        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="power",
+        name="RK6006 Power",
+        native_unit_of_measurement=UnitOfPower.WATT,
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="input_voltage",
+        name="RK6006 Input Voltage",
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="temp_internal",
+        name="RK6006 Internal Temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="temp_external",
+        name="RK6006 External Temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        # Disabled by default: only useful with a probe connected
+        entity_registry_enabled_default=False,
+    ),
+    SensorEntityDescription(
+        key="amp_hours",
+        name="RK6006 Amp Hours",
+        native_unit_of_measurement="Ah",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    SensorEntityDescription(
+        key="watt_hours",
+        name="RK6006 Watt Hours",
+        native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -30,59 +91,38 @@ async def async_setup_entry(
     """Set up RK6006 sensors."""
     coordinator: RK6006Coordinator = hass.data[DOMAIN][entry.entry_id]
 
-    async_add_entities(
-        [
-            RK6006Sensor(coordinator, "voltage", "Voltage", UnitOfElectricPotential.VOLT, SensorDeviceClass.VOLTAGE),
-            RK6006Sensor(coordinator, "current", "Current", UnitOfElectricCurrent.AMPERE, SensorDeviceClass.CURRENT),
-            RK6006Sensor(coordinator, "power", "Power", UnitOfPower.WATT, SensorDeviceClass.POWER),
-            RK6006Sensor(coordinator, "input_voltage", "Input Voltage", UnitOfElectricPotential.VOLT, SensorDeviceClass.VOLTAGE),
-            RK6006Sensor(coordinator, "temp_internal", "Internal Temperature", UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE),
-            RK6006Sensor(coordinator, "temp_external", "External Temperature", UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE),
-            RK6006Sensor(coordinator, "amp_hours", "Amp Hours", "Ah", None, SensorStateClass.TOTAL_INCREASING),
-            RK6006Sensor(coordinator, "watt_hours", "Watt Hours", UnitOfEnergy.WATT_HOUR, SensorDeviceClass.ENERGY, SensorStateClass.TOTAL_INCREASING),
-            RK6006ProtectionSensor(coordinator),
-        ]
-    )
+    entities: list[SensorEntity] = [
+        RK6006Sensor(coordinator, description)
+        for description in SENSOR_DESCRIPTIONS
+    ]
+    entities.append(RK6006ProtectionSensor(coordinator))
+    async_add_entities(entities)
 
 
 class RK6006Sensor(CoordinatorEntity, SensorEntity):
-    """Representation of an RK6006 sensor."""
+    """Sensor driven by an entity description."""
 
     def __init__(
         self,
         coordinator: RK6006Coordinator,
-        key: str,
-        name: str,
-        unit: str | None,
-        device_class: SensorDeviceClass | None = None,
-        state_class: SensorStateClass | None = SensorStateClass.MEASUREMENT,
+        description: SensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
-        self._key = key
-        self._attr_name = f"RK6006 {name}"
-        self._attr_unique_id = f"{coordinator.address}_{key}"
-        self._attr_native_unit_of_measurement = unit
-        self._attr_device_class = device_class
-        self._attr_state_class = state_class
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.address)},
-            "name": "RK6006 Power Supply",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-        }
-        # Disable external temp sensor by default if no probe detected
-        if key == "temp_external":
-            self._attr_entity_registry_enabled_default = False
-
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        value = self.coordinator.data.get(self._key)
-        # Don't show external temp if no probe
-        if self._key == "temp_external" and value is None:
-            return None
-        return value
+        self.entity_description = description
+        self._attr_unique_id = f"{coordinator.address}_{description.key}"
+        self._attr_device_info = coordinator.device_info
+
+    async def async_added_to_hass(self) -> None:
+        """Seed the pushed value from data fetched before we were added."""
+        await super().async_added_to_hass()
+        self._handle_coordinator_update()
+
+    def _handle_coordinator_update(self) -> None:
+        """Push the updated value instead of resolving it per state read."""
+        if (data := self.coordinator.data) is not None:
+            self._attr_native_value = getattr(data, self.entity_description.key)
+        self.async_write_ha_state()
 
 
 class RK6006ProtectionSensor(CoordinatorEntity, SensorEntity):
@@ -95,23 +135,19 @@ class RK6006ProtectionSensor(CoordinatorEntity, SensorEntity):
         super().__init__(coordinator)
         self._attr_name = "RK6006 Protection Status"
         self._attr_unique_id = f"{coordinator.address}_protection_status"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.address)},
-            "name": "RK6006 Power Supply",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-        }
-
-    @property
-    def native_value(self):
-        """Return the protection status."""
-        status = self.coordinator.data.get("protection_status", "unknown")
-        return status.upper()
-
-    @property
-    def extra_state_attributes(self):
-        """Return additional attributes."""
-        return {
-            "ovp_triggered": self.coordinator.data.get("ovp_triggered", False),
-            "ocp_triggered": self.coordinator.data.get("ocp_triggered", False),
-        }
+        self._attr_device_info = coordinator.device_info
+
+    async def async_added_to_hass(self) -> None:
+        """Seed the pushed value from data fetched before we were added."""
+        await super().async_added_to_hass()
+        self._handle_coordinator_update()
+
+    def _handle_coordinator_update(self) -> None:
+        """Push the updated status and attributes."""
+        if (data := self.coordinator.data) is not None:
+            self._attr_native_value = data.protection_status.upper()
+            self._attr_extra_state_attributes = {
+                "ovp_triggered": data.ovp_triggered,
+                "ocp_triggered": data.ocp_triggered,
+            }
+        self.async_write_ha_state()
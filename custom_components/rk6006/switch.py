@@ -1,6 +1,7 @@
 """Switch platform for RK6006 Power Supply."""
 from __future__ import annotations
 
+from functools import cached_property
 from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
@@ -9,9 +10,29 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER, MODEL
+from .const import DOMAIN
 from .coordinator import RK6006Coordinator
 
+# (name, icon, unique-id suffix, data key, coordinator setter)
+_SWITCH_SPECS: tuple[tuple[str, str, str, str, str], ...] = (
+    ("RK6006 Output", "mdi:power", "_output", "output_enabled", "async_set_output"),
+    ("RK6006 Buzzer", "mdi:volume-high", "_buzzer", "buzzer", "async_set_buzzer"),
+    (
+        "RK6006 Power On Boot",
+        "mdi:power-plug",
+        "_power_on_boot",
+        "power_on_boot",
+        "async_set_power_on_boot",
+    ),
+    (
+        "RK6006 Take Out",
+        "mdi:tray-arrow-up",
+        "_take_out",
+        "take_out",
+        "async_set_take_out",
+    ),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -21,186 +42,130 @@ async def async_setup_entry(
     """Set up RK6006 switch."""
     coordinator: RK6006Coordinator = hass.data[DOMAIN][entry.entry_id]
 
-    async_add_entities([
-        RK6006OutputSwitch(coordinator),
-        RK6006ConnectionSwitch(coordinator),
-        RK6006BuzzerSwitch(coordinator),
-        RK6006PowerOnBootSwitch(coordinator),
-        RK6006TakeOutSwitch(coordinator),
-    ])
-
-
-class RK6006OutputSwitch(CoordinatorEntity, SwitchEntity):
-    """Output switch entity."""
-
-    def __init__(self, coordinator: RK6006Coordinator) -> None:
+    addr = coordinator.address
+    async_add_entities(
+        (
+            *(_RK6006BoolSwitch(coordinator, addr, *spec) for spec in _SWITCH_SPECS),
+            RK6006ConnectionSwitch(coordinator, addr),
+        )
+    )
+
+
+class _RK6006BoolSwitch(CoordinatorEntity, SwitchEntity):
+    """Switch backed by a boolean field on the coordinator data.
+
+    is_on is cached between coordinator pushes so repeated state reads
+    within one update cycle cost a plain attribute lookup.
+    """
+
+    def __init__(
+        self,
+        coordinator: RK6006Coordinator,
+        address: str,
+        name: str,
+        icon: str,
+        uid_suffix: str,
+        data_key: str,
+        setter: str,
+    ) -> None:
         """Initialize the switch."""
         super().__init__(coordinator)
-        self._attr_name = "RK6006 Output"
-        self._attr_unique_id = f"{coordinator.address}_output"
-        self._attr_icon = "mdi:power"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.address)},
-            "name": "RK6006 Power Supply",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-        }
-
-    @property
+        self._attr_name = name
+        self._attr_icon = icon
+        self._attr_unique_id = address + uid_suffix
+        self._attr_device_info = coordinator.device_info
+        self._data_key = data_key
+        self._setter = getattr(coordinator, setter)
+        self._last_state: tuple[bool, bool] | None = None
+
+    @cached_property
     def is_on(self) -> bool:
-        """Return true if output is on."""
-        return self.coordinator.data.get("output_enabled", False)
+        """Return true if the backing field is set."""
+        return (data := self.coordinator.data) is not None and getattr(
+            data, self._data_key
+        )
+
+    def _handle_coordinator_update(self) -> None:
+        """Invalidate the cached state and skip no-op writes."""
+        self.__dict__.pop("is_on", None)
+        # Only write when our value or availability actually changed;
+        # other fields change every poll but do not affect this entity
+        state = (self.available, self.is_on)
+        if state == self._last_state:
+            return
+        self._last_state = state
+        self.async_write_ha_state()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn the output on."""
-        await self.coordinator.async_set_output(True)
+        """Turn the switch on."""
+        await self._setter(True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        """Turn the output off."""
-        await self.coordinator.async_set_output(False)
+        """Turn the switch off."""
+        await self._setter(False)
 
 
 class RK6006ConnectionSwitch(CoordinatorEntity, SwitchEntity):
     """Connection control switch entity."""
-    
+
     # Override to prevent CoordinatorEntity from making us unavailable
     _attr_available = True
+    _attr_name = "RK6006 Connection"
 
-    def __init__(self, coordinator: RK6006Coordinator) -> None:
+    _ICON_ON = "mdi:bluetooth-connect"
+    _ICON_OFF = "mdi:bluetooth-off"
+
+    def __init__(self, coordinator: RK6006Coordinator, address: str) -> None:
         """Initialize the switch."""
         super().__init__(coordinator)
-        self._attr_name = "RK6006 Connection"
-        self._attr_unique_id = f"{coordinator.address}_connection"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.address)},
-            "name": "RK6006 Power Supply",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-        }
+        self._attr_unique_id = address + "_connection"
+        self._attr_device_info = coordinator.device_info
+        self._last_is_on: bool | None = None
 
     @property
     def available(self) -> bool:
         """Return True - connection switch is always available."""
         return True
-    
+
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
         # Force initial state update even if coordinator is unavailable
         self.async_write_ha_state()
-    
+
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        # Always update state even when coordinator fails
-        # This ensures the switch reflects the actual connection_enabled state
+        # The switch tracks connection_enabled, not coordinator success,
+        # so only write when that flag actually flipped
+        self.__dict__.pop("is_on", None)
+        self.__dict__.pop("icon", None)
+        if (state := self.is_on) == self._last_is_on:
+            return
+        self._last_is_on = state
         self.async_write_ha_state()
 
-    @property
+    @cached_property
     def is_on(self) -> bool:
         """Return true if connection is enabled."""
         return self.coordinator.connection_enabled
 
-    @property
+    @cached_property
     def icon(self) -> str:
-        """Return icon based on state."""
-        return "mdi:bluetooth-connect" if self.is_on else "mdi:bluetooth-off"
+        """Return icon based on state; cached until the state changes."""
+        return self._ICON_ON if self.is_on else self._ICON_OFF
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Enable connection."""
         await self.coordinator.async_enable_connection()
+        self.__dict__.pop("is_on", None)
+        self.__dict__.pop("icon", None)
+        self._last_is_on = self.is_on
         self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Disable connection."""
         await self.coordinator.async_disable_connection()
+        self.__dict__.pop("is_on", None)
+        self.__dict__.pop("icon", None)
+        self._last_is_on = self.is_on
         self.async_write_ha_state()
-
-
-class RK6006BuzzerSwitch(CoordinatorEntity, SwitchEntity):
-    """Buzzer switch entity."""
-
-    def __init__(self, coordinator: RK6006Coordinator) -> None:
-        """Initialize the switch."""
-        super().__init__(coordinator)
-        self._attr_name = "RK6006 Buzzer"
-        self._attr_unique_id = f"{coordinator.address}_buzzer"
-        self._attr_icon = "mdi:volume-high"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.address)},
-            "name": "RK6006 Power Supply",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-        }
-
-    @property
-    def is_on(self) -> bool:
-        """Return true if buzzer is enabled."""
-        return self.coordinator.data.get("buzzer", False)
-
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        """Enable buzzer."""
-        await self.coordinator.async_set_buzzer(True)
-
-    async def async_turn_off(self, **kwargs: Any) -> None:
-        """Disable buzzer."""
-        await self.coordinator.async_set_buzzer(False)
-
-
-class RK6006PowerOnBootSwitch(CoordinatorEntity, SwitchEntity):
-    """Power on boot switch entity."""
-
-    def __init__(self, coordinator: RK6006Coordinator) -> None:
-        """Initialize the switch."""
-        super().__init__(coordinator)
-        self._attr_name = "RK6006 Power On Boot"
-        self._attr_unique_id = f"{coordinator.address}_power_on_boot"
-        self._attr_icon = "mdi:power-plug"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.address)},
-            "name": "RK6006 Power Supply",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-        }
-
-    @property
-    def is_on(self) -> bool:
-        """Return true if power on boot is enabled."""
-        return self.coordinator.data.get("power_on_boot", False)
-
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        """Enable power on boot."""
-        await self.coordinator.async_set_power_on_boot(True)
-
-    async def async_turn_off(self, **kwargs: Any) -> None:
-        """Disable power on boot."""
-        await self.coordinator.async_set_power_on_boot(False)
-
-
-class RK6006TakeOutSwitch(CoordinatorEntity, SwitchEntity):
-    """Take out switch entity."""
-
-    def __init__(self, coordinator: RK6006Coordinator) -> None:
-        """Initialize the switch."""
-        super().__init__(coordinator)
-        self._attr_name = "RK6006 Take Out"
-        self._attr_unique_id = f"{coordinator.address}_take_out"
-        self._attr_icon = "mdi:tray-arrow-up"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.address)},
-            "name": "RK6006 Power Supply",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-        }
-
-    @property
-    def is_on(self) -> bool:
-        """Return true if take out is enabled."""
-        return self.coordinator.data.get("take_out", False)
-
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        """Enable take out."""
-        await self.coordinator.async_set_take_out(True)
-
-    async def async_turn_off(self, **kwargs: Any) -> None:
-        """Disable take out."""
-        await self.coordinator.async_set_take_out(False)